@@ -14,6 +14,34 @@ from mercuryorm.exceptions import (
 from mercuryorm.record_manager import RecordManager
 
 
+def _compile_to_dict(cls):
+    """
+    Generates a `to_dict` specialized for the fields declared on `cls`: one
+    straight-line function, with no class scan or per-field loop at call time.
+    """
+    lines = ["def to_dict(self):", "    values = self.__dict__", "    data = {"]
+    lines += [
+        f"        {field_name!r}: values.get({field_name!r}),"
+        for field_name in cls._field_names  # pylint: disable=protected-access
+    ]
+    lines.append("    }")
+    for field_name in fields.DEFAULT_FIELD_NAMES:
+        lines += [
+            f"    value = values.get({field_name!r})",
+            "    if value is not None:",
+            f"        data[{field_name!r}] = value",
+        ]
+    lines.append("    return data")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = CustomObject.to_dict.__doc__
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.generated = True
+    return to_dict
+
+
 class CustomObject:
     """
     A base class for custom objects that are synchronized with the Zendesk API.
@@ -22,22 +50,60 @@ class CustomObject:
     format for API communication. Automatically assigns a RecordManager to child classes.
     """
 
+    _field_items = ()
+    _field_names = ()
+    _name_autoincrement = False
+
     def __init_subclass__(cls, **kwargs):
         """
         This method is called automatically whenever a subclass of CustomObject is created.
         It automatically assigns the RecordManager to the child class,
-        without the need to define 'objects' manually.
+        without the need to define 'objects' manually, and caches the
+        `(name, field)` pairs declared on the class.
         """
         super().__init_subclass__(**kwargs)
+        cls._field_items = tuple(
+            (field_name, field)
+            for field_name, field in cls.__dict__.items()
+            if isinstance(field, fields.Field)
+        )
+        cls._field_names = tuple(field_name for field_name, _ in cls._field_items)
+        cls._records_path = f"/custom_objects/{cls.__name__.lower()}/records"
+        name_field = cls.__dict__.get("name")
+        cls._name_autoincrement = (
+            isinstance(name_field, fields.NameField)
+            and name_field.autoincrement_enabled
+        )
+        if cls.to_dict is CustomObject.to_dict or getattr(
+            cls.to_dict, "generated", False
+        ):
+            cls.to_dict = _compile_to_dict(cls)
         cls.objects = RecordManager(cls)
 
     def __init__(self, **kwargs):
-        self.client = ZendeskAPIClient()
         self.id = None  # pylint: disable=invalid-name
         self.name = None
-        for field_name, field in self.__class__.__dict__.items():
-            if isinstance(field, fields.Field):
-                setattr(self, field_name, kwargs.get(field_name))
+        field_names = self._field_names
+        if kwargs:
+            self.__dict__.update(zip(field_names, map(kwargs.get, field_names)))
+        else:
+            self.__dict__.update(dict.fromkeys(field_names))
+
+    @property
+    def client(self):
+        """
+        Returns the client assigned to this record, or else the process-wide
+        `ZendeskAPIClient`, so records share its connection pool instead of
+        each opening their own session.
+        """
+        return self.__dict__.get("client") or ZendeskAPIClient.default()
+
+    @client.setter
+    def client(self, client):
+        """
+        Assigns a client to this record only, e.g. for another account.
+        """
+        self.__dict__["client"] = client
 
     def __str__(self):
         return self.__class__.__name__
@@ -50,16 +116,28 @@ class CustomObject:
 
     def is_namefield_autoincrement(self):
         """Check if the object has a NameField and if its autoincrement is enabled."""
-        # Encontra o campo 'name' na classe
-        name_field = next(
-            (value for key, value in self.__class__.__dict__.items() if key == "name"),
-            None,
-        )
+        return self._name_autoincrement
 
-        if isinstance(name_field, fields.NameField):
-            return name_field.autoincrement_enabled
+    def record_payload(self):
+        """
+        Builds the `custom_object_record` body sent to Zendesk when saving,
+        shared by `save()` and `RecordManager.bulk_create()`.
 
-        return False
+        Returns:
+            dict: The record's fields, name and external ID.
+        """
+        values = self.__dict__
+        return {
+            "custom_object_fields": self.to_dict(),
+            # -> If object not contains a NameField type
+            # the name field is Unnamed Object or a name passed
+            "name": (
+                values.get("name") or "Unnamed Object"
+                if not self._name_autoincrement
+                else None
+            ),
+            "external_id": values.get("external_id"),
+        }
 
     def save(self):
         """
@@ -70,39 +148,27 @@ class CustomObject:
             UpdateRecordError: If the record could not be updated.
             UniqueConstraintError: If a unique constraint is violated.
         """
-        data = {
-            "custom_object_record": {
-                "custom_object_fields": self.to_dict(),
-                "name": (
-                    getattr(self, "name") or "Unnamed Object"
-                    if not self.is_namefield_autoincrement()
-                    else None
-                ),
-                "external_id": getattr(self, "external_id", None),
-            }
-        }
-        # -> If object not contains a NameField type
-        # the name field is Unnamed Object or a name passed
+        values = self.__dict__
+        data = {"custom_object_record": self.record_payload()}
 
-        if not hasattr(self, "id") or not self.id:
-            response = self.client.post(
-                f"/custom_objects/{self.__class__.__name__.lower()}/records", data
-            )
+        if not values.get("id"):
+            response = self.client.post(self._records_path, data)
+            details = response.get("details")
             if (
-                response.get("details", {}).get("base", [{}])[0].get("description", "")
+                isinstance(details, dict)
+                and details.get("base", [{}])[0].get("description")
                 == "Name already exists. Try another one."
             ):
-                raise UniqueConstraintError(getattr(self, "name"))
+                raise UniqueConstraintError(values.get("name"))
             if response.get("status_code", 201) != 201:
                 raise CreateRecordError(
                     message=response.get("details", "Error creating record")
                 )
-            self.id = response["custom_object_record"]["id"]
-            self.name = response["custom_object_record"]["name"]
+            record = response["custom_object_record"]
+            self.id = record["id"]
+            self.name = record["name"]
             return response
-        response = self.client.patch(
-            f"/custom_objects/{self.__class__.__name__.lower()}/records/{self.id}", data
-        )
+        response = self.client.patch(f"{self._records_path}/{self.id}", data)
         if response.get("status_code", 200) != 200:
             raise UpdateRecordError(
                 message=response.get("details", "Error updating record")
@@ -116,9 +182,7 @@ class CustomObject:
         Raises:
             DeleteRecordError: If the record could not be deleted.
         """
-        response = self.client.delete(
-            f"/custom_objects/{self.__class__.__name__}/records/{self.id}"
-        )
+        response = self.client.delete(f"{self._records_path}/{self.id}")
         if response.get("status_code", 204) != 204:
             raise DeleteRecordError(
                 message=response.get("description", "Error deleting record")
@@ -134,23 +198,10 @@ class CustomObject:
         Returns:
             dict: A dictionary containing the object's fields and values.
         """
-        default_fields = {
-            "id": getattr(self, "id", None),
-            "name": getattr(self, "name", None),
-            "created_at": getattr(self, "created_at", None),
-            "updated_at": getattr(self, "updated_at", None),
-            "created_by_user_id": getattr(self, "created_by_user_id", None),
-            "updated_by_user_id": getattr(self, "updated_by_user_id", None),
-            "external_id": getattr(self, "external_id", None),
-        }
-
-        custom_fields = {
-            field_name: getattr(self, field_name)
-            for field_name, field in self.__class__.__dict__.items()
-            if isinstance(field, fields.Field)
-        }
-
-        default_fields = {
-            key: value for key, value in default_fields.items() if value is not None
-        }
-        return {**custom_fields, **default_fields}
+        values = self.__dict__
+        data = {field_name: values.get(field_name) for field_name in self._field_names}
+        for field_name in fields.DEFAULT_FIELD_NAMES:
+            value = values.get(field_name)
+            if value is not None:
+                data[field_name] = value
+        return data
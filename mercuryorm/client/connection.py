@@ -3,36 +3,264 @@ This module contains the `ZendeskAPIClient` class responsible for
 handling requests to the Zendesk API.
 """
 
+import functools
 import os
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv  # pylint: disable=import-error
+from urllib3.util.retry import Retry
 
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+HTTP2_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP2_MAX_CONNECTIONS = 40
 
-load_dotenv()
+REQUIRED_ENV_VARS = ("ZENDESK_EMAIL", "ZENDESK_API_TOKEN", "ZENDESK_SUBDOMAIN")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """
+    Loads the `.env` file into the environment, at most once per process.
+    """
+    from dotenv import (  # pylint: disable=import-error,import-outside-toplevel
+        load_dotenv,
+    )
+
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_settings():
+    """
+    Resolves the environment settings once per process.
+
+    Returns:
+        tuple: `(email, api_token, base_url, auth)` for the default account.
+    """
+    if any(name not in os.environ for name in REQUIRED_ENV_VARS):
+        _load_env()
+    email = os.getenv("ZENDESK_EMAIL", "mock@mock.com")
+    api_token = os.getenv("ZENDESK_API_TOKEN", "mock_token")
+    base_url = (
+        f"https://{os.getenv('ZENDESK_SUBDOMAIN', 'mockdomain')}.zendesk.com/api/v2"
+    )
+    return email, api_token, base_url, HTTPBasicAuth(f"{email}/token", api_token)
+
+
+class RateLimitRetry(Retry):
+    """
+    Retry policy that also retries non-idempotent requests (POST, PATCH) when
+    Zendesk rejects them with 429 Too Many Requests, waiting for the
+    `Retry-After` header. A rate-limited request was never processed, so
+    sending it again cannot create duplicates; other statuses keep the default
+    idempotent-only behaviour.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _dumps(payload):
+    """
+    Serializes a request body to JSON bytes with `orjson`, falling back to the
+    standard library for values `orjson` rejects (e.g. integers over 64 bits).
+    """
+    try:
+        return orjson.dumps(payload)
+    except orjson.JSONEncodeError:
+        return json.dumps(payload).encode()
 
 
 class ZendeskAPIClient:
     """
     A client to interact with the Zendesk API, supporting basic CRUD operations.
+
+    Requests are sent through a pooled `requests.Session`. Setting the environment
+    variable `MERCURY_USE_HTTP2=1` switches to an `httpx` client speaking HTTP/2
+    (requires `pip install mercury-orm[http2]`).
     """
 
-    def __init__(self, email=os.getenv("ZENDESK_EMAIL", "mock@mock.com")):
+    _http = None
+
+    def __init__(self, email=None):
         """
         Initializes the ZendeskAPIClient with authentication details.
 
+        The environment (and, when a required variable is missing, the `.env` file)
+        is only read by the first client; later clients reuse the resolved settings.
+
         Args:
-            email (str): The email associated with the Zendesk account
+            email (str, optional): The email associated with the Zendesk account
             (default: from environment variable).
         """
-        self.email = email
-        self.api_token = os.getenv("ZENDESK_API_TOKEN", "mock_token")
-        self.base_url = (
-            f"https://{os.getenv('ZENDESK_SUBDOMAIN', 'mockdomain')}.zendesk.com/api/v2"
-        )
+        default_email, self.api_token, self.base_url, default_auth = _default_settings()
+        self.email = email or default_email
         self.headers = {"Content-Type": "application/json"}
-        self.auth = HTTPBasicAuth(f"{self.email}/token", self.api_token)
+        self.auth = (
+            default_auth
+            if self.email == default_email
+            else HTTPBasicAuth(f"{self.email}/token", self.api_token)
+        )
+        self.session = None
+        if os.getenv("MERCURY_USE_HTTP2") == "1":
+            self._http = self._create_http2_client()
+        else:
+            self.session = self._create_session()
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def default(cls):
+        """
+        Returns the process-wide client built from the environment settings.
+
+        Sharing one instance lets every manager reuse the same connection pool.
+
+        Returns:
+            ZendeskAPIClient: The shared client.
+        """
+        return cls()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def for_email(cls, email):
+        """
+        Returns a client shared by every caller using the same account email.
+
+        Managers created for the same account then reuse one connection pool
+        instead of each opening their own. Clients are kept for the life of the
+        process (one per account), so no pool is dropped without being closed.
+
+        Args:
+            email (str): The email associated with the Zendesk account.
+
+        Returns:
+            ZendeskAPIClient: The shared client for `email`.
+        """
+        if email == _default_settings()[0]:
+            return cls.default()
+        return cls(email)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_session(self):
+        """
+        Creates a pooled HTTP session shared by every request of this client,
+        so TCP/TLS connections to Zendesk are reused across calls.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        session.auth = self.auth
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RateLimitRetry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+                respect_retry_after_header=True,
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _create_http2_client(self):
+        """
+        Creates an `httpx` client with HTTP/2 enabled, multiplexing requests to
+        Zendesk over a single connection.
+
+        Returns:
+            httpx.Client: The configured client.
+
+        Raises:
+            ImportError: If `httpx` (with HTTP/2 support) is not installed.
+        """
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError(
+                "MERCURY_USE_HTTP2=1 requires httpx: pip install mercury-orm[http2]"
+            ) from error
+        return httpx.Client(
+            http2=True,
+            base_url=self.base_url,
+            auth=(f"{self.email}/token", self.api_token),
+            headers=self.headers,
+            timeout=10,
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP2_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=HTTP2_MAX_CONNECTIONS,
+            ),
+        )
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        if self._http is not None:
+            self._http.close()
+        else:
+            self.session.close()
+
+    def _request(self, method, endpoint, payload=None, **kwargs):
+        """
+        Sends a request through the configured HTTP backend.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint, relative to `base_url`.
+            payload (dict, optional): The JSON body, serialized with `_dumps`.
+            **kwargs: Extra arguments for the backend (params, timeout).
+
+        Returns:
+            The backend response (`requests.Response` or `httpx.Response`).
+        """
+        if self._http is not None:
+            if payload is not None:
+                kwargs["content"] = _dumps(payload)
+            return self._http.request(method, endpoint, **kwargs)
+        if payload is not None:
+            kwargs["data"] = _dumps(payload)
+        return self.session.request(method, f"{self.base_url}{endpoint}", **kwargs)
+
+    def _raise_for_status(self, response):
+        """
+        Raises `requests.exceptions.HTTPError` for 4xx/5xx responses, whatever
+        the backend, so callers handle a single exception type.
+        """
+        if self._http is None:
+            response.raise_for_status()
+        elif response.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} Error for url: {response.url}",
+                response=response,
+            )
+
+    @staticmethod
+    def _decode(response):
+        """
+        Decodes the JSON body of a response with `orjson`.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        try:
+            return orjson.loads(response.content)
+        except ValueError:
+            # Let the backend's stdlib decoder raise, so the error message is stable.
+            return response.json()
 
     def get(self, endpoint, params=None, timeout=10):
         """
@@ -49,16 +277,15 @@ class ZendeskAPIClient:
         Raises:
             requests.exceptions.HTTPError: If the request fails.
         """
-        response = requests.get(
-            f"{self.base_url}{endpoint}",
-            headers=self.headers,
+        response = self._request(
+            "GET",
+            endpoint,
             params=params,
-            auth=self.auth,
             timeout=timeout,
         )
-        response.raise_for_status()
+        self._raise_for_status(response)
         try:
-            return response.json()
+            return self._decode(response)
         except json.JSONDecodeError as json_error:
             return {
                 "error": {"title": response.text, "message": str(json_error)},
@@ -80,17 +307,16 @@ class ZendeskAPIClient:
         Raises:
             requests.exceptions.HTTPError: If the request fails.
         """
-        response = requests.post(
-            f"{self.base_url}{endpoint}",
-            headers=self.headers,
-            json=data,
-            auth=self.auth,
+        response = self._request(
+            "POST",
+            endpoint,
+            payload=data,
             timeout=timeout,
             params=params,
         )
         try:
-            data = response.json()
-            if not response.ok:
+            data = self._decode(response)
+            if response.status_code >= 400:
                 data.update({"status_code": response.status_code})
             return data
         except json.JSONDecodeError as json_error:
@@ -114,16 +340,15 @@ class ZendeskAPIClient:
         Raises:
             requests.exceptions.HTTPError: If the request fails.
         """
-        response = requests.patch(
-            f"{self.base_url}{endpoint}",
-            headers=self.headers,
-            json=data,
-            auth=self.auth,
+        response = self._request(
+            "PATCH",
+            endpoint,
+            payload=data,
             timeout=timeout,
         )
         try:
-            data = response.json()
-            if not response.ok:
+            data = self._decode(response)
+            if response.status_code >= 400:
                 data.update({"status_code": response.status_code})
             return data
         except json.JSONDecodeError as json_error:
@@ -147,16 +372,15 @@ class ZendeskAPIClient:
         Raises:
             requests.exceptions.HTTPError: If the request fails.
         """
-        response = requests.put(
-            f"{self.base_url}{endpoint}",
-            headers=self.headers,
-            json=data,
-            auth=self.auth,
+        response = self._request(
+            "PUT",
+            endpoint,
+            payload=data,
             timeout=timeout,
         )
         try:
-            data = response.json()
-            if not response.ok:
+            data = self._decode(response)
+            if response.status_code >= 400:
                 data.update({"status_code": response.status_code})
             return data
         except json.JSONDecodeError as json_error:
@@ -179,17 +403,16 @@ class ZendeskAPIClient:
         Raises:
             requests.exceptions.HTTPError: If the request fails.
         """
-        response = requests.delete(
-            f"{self.base_url}{endpoint}",
-            headers=self.headers,
-            auth=self.auth,
+        response = self._request(
+            "DELETE",
+            endpoint,
             timeout=timeout,
         )
         if response.status_code == 204:
             return {"status_code": 204}
         try:
-            data = response.json()
-            if not response.ok:
+            data = self._decode(response)
+            if response.status_code >= 400:
                 data.update({"status_code": response.status_code})
             return data
         except json.JSONDecodeError as json_error:
@@ -4,6 +4,17 @@ This module defines different types of fields that can be used
 to represent and manage data within custom objects.
 """
 
+# Attributes Zendesk sets on every custom object record, besides its fields.
+DEFAULT_FIELD_NAMES = (
+    "id",
+    "name",
+    "created_at",
+    "updated_at",
+    "created_by_user_id",
+    "updated_by_user_id",
+    "external_id",
+)
+
 
 class Field:  # pylint: disable=too-few-public-methods
     """
@@ -14,6 +25,8 @@ class Field:  # pylint: disable=too-few-public-methods
         field_type (type): The type of the field (e.g., str, int).
     """
 
+    __slots__ = ("name", "field_type")
+
     def __init__(self, name, field_type):
         """
         Initializes a Field object.
@@ -33,6 +46,14 @@ class NameField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses string as its data type.
     """
 
+    __slots__ = (
+        "unique",
+        "autoincrement_enabled",
+        "autoincrement_prefix",
+        "autoincrement_padding",
+        "autoincrement_next_sequence",
+    )
+
     def __init__(
         self,
         unique=False,
@@ -68,6 +89,8 @@ class TextField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses string as its data type.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initializes a TextField object.
@@ -85,6 +108,8 @@ class TextareaField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses string as its data type.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initializes a TextareaField object.
@@ -102,6 +127,8 @@ class CheckboxField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses boolean as its data type.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initializes a CheckboxField object.
@@ -119,6 +146,8 @@ class DateField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses a string representation of a date.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initializes a DateField object.
@@ -136,6 +165,8 @@ class IntegerField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses integer as its data type.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initializes an IntegerField object.
@@ -153,6 +184,8 @@ class DecimalField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses float as its data type.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initializes a DecimalField object.
@@ -170,6 +203,8 @@ class RegexpField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses a regular expression pattern.
     """
 
+    __slots__ = ("pattern",)
+
     def __init__(self, name, pattern):
         """
         Initializes a RegexpField object.
@@ -189,6 +224,8 @@ class DropdownField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and allows a set of predefined choices.
     """
 
+    __slots__ = ("choices",)
+
     def __init__(self, name, choices):
         """
         Initializes a DropdownField object.
@@ -208,6 +245,8 @@ class LookupField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and uses a related custom object.
     """
 
+    __slots__ = ("related_object", "is_custom_object")
+
     def __init__(self, name, related_object, is_custom_object=True):
         """
         Initializes a LookupField object.
@@ -264,6 +303,8 @@ class MultiselectField(Field):  # pylint: disable=too-few-public-methods
     Inherits from Field and allows multiple choices to be selected.
     """
 
+    __slots__ = ("choices",)
+
     def __init__(self, name, choices):
         """
         Initializes a MultiselectField object.
@@ -4,6 +4,7 @@ For Manager and querysets to Records CustomObject
 
 from urllib.parse import parse_qs, urlparse
 from mercuryorm.client.connection import ZendeskAPIClient
+from mercuryorm.fields import DEFAULT_FIELD_NAMES
 
 
 class QuerySet:
@@ -14,13 +15,13 @@ class QuerySet:
     def __init__(self, model):
         self.model = model
         self.base_url = f"/custom_objects/{self.model.__name__.lower()}/records"
-        self.client = ZendeskAPIClient()
+        self.client = ZendeskAPIClient.default()
 
     def all(self):
         """
         Returns the 100 first records from the Custom Object without metadata or links.
         """
-        response = self.client.get(self.base_url)
+        response = self.client.get(self.base_url, params={"page[size]": 100})
         records = self._parse_response(response)
         return records
 
@@ -28,14 +29,15 @@ class QuerySet:
         """
         Returns all records from the Custom Object, handling pagination automatically.
         """
-        records = []
-        next_cursor = None
+        return list(self.iter_all())
 
+    def iter_all(self, page_size=100):
+        """
+        Yields all records from the Custom Object, requesting one page at a time
+        and following the cursor in `links.next`.
+        """
+        params = {"page[size]": page_size}
         while True:
-            params = {"page[size]": 100}
-            if next_cursor:
-                params["page[after]"] = next_cursor
-
             response = self.client.get(self.base_url, params=params)
 
             if "error" in response:
@@ -43,17 +45,17 @@ class QuerySet:
                     f"Error from Zendesk API: {response['error']} - {response.get('description')}"
                 )
 
-            records.extend(self._parse_response(response))
-
-            links = response.get("links", {})
-            next_cursor_url = links.get("next")
+            yield from self._parse_response(response)
 
+            next_cursor_url = response.get("links", {}).get("next")
             if not next_cursor_url:
                 break
 
             parsed_url = urlparse(next_cursor_url)
             next_cursor = parse_qs(parsed_url.query).get("page[after]", [None])[0]
-        return records
+            if not next_cursor:
+                break
+            params = {"page[size]": page_size, "page[after]": next_cursor}
 
     def all_with_pagination(self, page_size=100, after_cursor=None, before_cursor=None):
         """
@@ -156,10 +158,7 @@ class QuerySet:
         if before_cursor:
             params["page[before]"] = before_cursor
 
-        response = self.client.get(
-            f"/custom_objects/{self.model.__name__.lower()}/records/search",
-            params=params,
-        )
+        response = self.client.get(f"{self.base_url}/search", params=params)
 
         results = []
         if response.get("custom_object_records"):
@@ -178,12 +177,10 @@ class QuerySet:
         """
         Filters records in memory based on the parameters provided.
         The Zendesk API does not support native filtering by custom fields, so
-        we take all records and filter them locally.
+        we take all records, page by page, and filter them locally.
         """
-        records = self.all()
-
         filtered_records = []
-        for record in records:
+        for record in self.iter_all():
             match = True
             for key, value in kwargs.items():
                 if getattr(record, key, None) != value:
@@ -198,9 +195,7 @@ class QuerySet:
         """
         Deletes a record by ID.
         """
-        response = self.client.get(
-            f"/custom_objects/{self.model.__name__.lower()}/records/count"
-        )
+        response = self.client.get(f"{self.base_url}/count")
         return response["count"]["value"]
 
     def _parse_response(self, response):
@@ -220,11 +215,7 @@ class QuerySet:
         fields = record_data.get("custom_object_fields", {})
         record = self.model(**fields)
         # Default Fields Zendesk
-        record.id = record_data.get("id")
-        record.name = record_data.get("name")
-        record.created_at = record_data.get("created_at")
-        record.updated_at = record_data.get("updated_at")
-        record.created_by_user_id = record_data.get("created_by_user_id")
-        record.updated_by_user_id = record_data.get("updated_by_user_id")
-        record.external_id = record_data.get("external_id")
+        vars(record).update(
+            zip(DEFAULT_FIELD_NAMES, map(record_data.get, DEFAULT_FIELD_NAMES))
+        )
         return record
@@ -3,10 +3,21 @@ This module handles the management of custom object records for integration
 with the Zendesk API, including creating, retrieving, and deleting records.
 """
 
+import asyncio
+
 import requests
 from mercuryorm.managers import QuerySet
 from mercuryorm.zendesk_manager import ZendeskAPIClient
-from mercuryorm.exceptions import BadRequestError, DeleteRecordError, NotFoundError
+from mercuryorm.exceptions import (
+    BadRequestError,
+    CreateRecordError,
+    DeleteRecordError,
+    NotFoundError,
+)
+
+ASYNC_MAX_CONCURRENCY = 20
+# Zendesk accepts at most 100 items per custom object records job.
+BULK_JOB_MAX_ITEMS = 100
 
 
 class RecordManager:
@@ -18,7 +29,10 @@ class RecordManager:
     def __init__(self, model):
         self.model = model
         self.queryset = QuerySet(model)
-        self.client = ZendeskAPIClient()
+        self.client = ZendeskAPIClient.default()
+        self._key = model.__name__.lower()
+        self._records_url = f"/custom_objects/{self._key}/records"
+        self._jobs_url = f"/custom_objects/{self._key}/jobs"
 
     def create(self, **kwargs):
         """
@@ -27,6 +41,46 @@ class RecordManager:
         record = self.model(**kwargs)
         return record.save()
 
+    def bulk_create(self, records, chunk_size=BULK_JOB_MAX_ITEMS):
+        """
+        Creates many records through the custom object records jobs endpoint,
+        sending one request per `chunk_size` records instead of one per record.
+
+        The jobs run asynchronously on Zendesk; the returned job statuses can be
+        polled to follow their progress.
+
+        Args:
+            records (iterable): Instances of the model to create.
+            chunk_size (int, optional): Records per job, at most 100.
+
+        Returns:
+            list: The `job_status` of each job submitted.
+
+        Raises:
+            ValueError: If `chunk_size` is not between 1 and 100.
+            CreateRecordError: If Zendesk rejects a job.
+        """
+        if not 1 <= chunk_size <= BULK_JOB_MAX_ITEMS:
+            raise ValueError(f"chunk_size must be between 1 and {BULK_JOB_MAX_ITEMS}.")
+        items = [record.record_payload() for record in records]
+        job_statuses = []
+        for start in range(0, len(items), chunk_size):
+            response = self.client.post(
+                self._jobs_url,
+                {
+                    "job": {
+                        "action": "create",
+                        "items": items[start : start + chunk_size],
+                    }
+                },
+            )
+            if response.get("status_code", 200) != 200:
+                raise CreateRecordError(
+                    message=response.get("details", "Error creating records")
+                )
+            job_statuses.append(response.get("job_status"))
+        return job_statuses
+
     def get(self, **kwargs):
         """
         Returns a single record based on the given parameters.
@@ -34,24 +88,40 @@ class RecordManager:
         Otherwise, uses the filter method for other criteria.
         """
         if "id" in kwargs:
-            record_id = kwargs.pop("id")
-            try:
-                response = self.client.get(
-                    f"/custom_objects/{self.model.__name__.lower()}/records/{record_id}"
-                )
-            except requests.exceptions.HTTPError as e:  # pylint: disable=invalid-name
-                if e.response.status_code == 400:
-                    error_response = e.response.json()
-                    raise BadRequestError(
-                        f"Bad request for record with ID {record_id}. Response: {error_response}"
-                    ) from e
-                if e.response.status_code == 404:
-                    raise NotFoundError(self.model.__name__, record_id) from e
-                raise e
-            record_data = response.get("custom_object_record", {})
-            record = self.queryset.parse_record_fields(record_data)
-            return record
+            return self._get_by_id(kwargs.pop("id"))
+        return self._get_by_filter(**kwargs)
+
+    def _get_by_id(self, record_id):
+        """
+        Internal method that fetches a single record by its ID.
+
+        Raises:
+            BadRequestError: If the API rejects the request (400).
+            NotFoundError: If the record does not exist (404).
+        """
+        try:
+            response = self.client.get(f"{self._records_url}/{record_id}")
+        except requests.exceptions.HTTPError as e:  # pylint: disable=invalid-name
+            status_code = e.response.status_code
+            if status_code == 404:
+                raise NotFoundError(self.model.__name__, record_id) from e
+            if status_code == 400:
+                raise BadRequestError(
+                    f"Bad request for record with ID {record_id}. "
+                    f"Response: {e.response.json()}"
+                ) from e
+            raise
+        return self.queryset.parse_record_fields(
+            response.get("custom_object_record", {})
+        )
+
+    def _get_by_filter(self, **kwargs):
+        """
+        Internal method that returns the only record matching the given criteria.
 
+        Raises:
+            ValueError: If no record, or more than one record, matches.
+        """
         result = self.filter(**kwargs)
         if len(result) == 0:
             raise ValueError(f"{self.model.__name__} matching query does not exist.")
@@ -88,9 +158,7 @@ class RecordManager:
         Raises:
             DeleteRecordError: If the record could not be deleted.
         """
-        response = self.client.delete(
-            f"/custom_objects/{self.model.__name__.lower()}/records/{record_id}"
-        )
+        response = self.client.delete(f"{self._records_url}/{record_id}")
         if response.get("status_code", 204) != 204:
             raise DeleteRecordError(
                 message=response.get("description", "Error deleting record")
@@ -105,9 +173,7 @@ class RecordManager:
         """
         params = {"sort": "-updated_at", "page[size]": 1}
 
-        response = self.client.get(
-            f"/custom_objects/{self.model.__name__.lower()}/records", params=params
-        )
+        response = self.client.get(self._records_url, params=params)
 
         if response.get("custom_object_records"):
             record = self.queryset.parse_record_fields(
@@ -121,9 +187,7 @@ class RecordManager:
         Returns the object with a word.
         """
         results = []
-        response = self.client.get(
-            f"/custom_objects/{self.model.__name__.lower()}/records/search?query={word}&sort="
-        )
+        response = self.client.get(f"{self._records_url}/search?query={word}&sort=")
         if response.get("custom_object_records"):
             records = response.get("custom_object_records", [])
             for record in records:
@@ -161,3 +225,124 @@ class RecordManager:
             after_cursor=after_cursor,
             before_cursor=before_cursor,
         )
+
+
+class AsyncRecordManager:
+    """
+    Asynchronous record manager for bulk operations: fetches or deletes many
+    records concurrently over a single HTTP/2 connection pool.
+
+    Requires `httpx` with HTTP/2 support (`pip install mercury-orm[http2]`).
+    The synchronous `RecordManager` remains the default `objects` manager.
+    """
+
+    def __init__(self, model, max_concurrency=ASYNC_MAX_CONCURRENCY):
+        self.model = model
+        self.queryset = QuerySet(model)
+        self._records_url = f"/custom_objects/{model.__name__.lower()}/records"
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def _get_client(self):
+        """
+        Internal method that lazily creates the `httpx.AsyncClient`, reused by
+        every call of this manager, and the concurrency semaphore. Both are
+        created inside the running event loop and dropped by `aclose()`.
+        """
+        if self._client is None:
+            try:
+                import httpx  # pylint: disable=import-outside-toplevel
+            except ImportError as error:
+                raise ImportError(
+                    "AsyncRecordManager requires httpx: pip install mercury-orm[http2]"
+                ) from error
+            client = ZendeskAPIClient.default()
+            self._client = httpx.AsyncClient(
+                http2=True,
+                base_url=client.base_url,
+                auth=(f"{client.email}/token", client.api_token),
+                headers=client.headers,
+                timeout=10,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self._max_concurrency,
+                    max_connections=self._max_concurrency,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._client
+
+    async def _request(self, method, record_id):
+        """
+        Internal method that sends a request for one record, bounded by the
+        concurrency semaphore.
+        """
+        client = self._get_client()
+        async with self._semaphore:
+            return await client.request(method, f"{self._records_url}/{record_id}")
+
+    async def get(self, record_id):
+        """
+        Returns a single record by ID.
+
+        Raises:
+            BadRequestError: If the API rejects the request (400).
+            NotFoundError: If the record does not exist (404).
+        """
+        response = await self._request("GET", record_id)
+        if response.status_code == 404:
+            raise NotFoundError(self.model.__name__, record_id)
+        if response.status_code == 400:
+            raise BadRequestError(
+                f"Bad request for record with ID {record_id}. "
+                f"Response: {response.text}"
+            )
+        if response.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} Error for url: {response.url}",
+                response=response,
+            )
+        return self.queryset.parse_record_fields(
+            response.json().get("custom_object_record", {})
+        )
+
+    async def get_many(self, record_ids):
+        """
+        Returns the records with the given IDs, fetched concurrently, in order.
+        """
+        return await asyncio.gather(*(self.get(record_id) for record_id in record_ids))
+
+    async def delete(self, record_id):
+        """
+        Deletes a record by ID.
+
+        Raises:
+            DeleteRecordError: If the record could not be deleted.
+        """
+        response = await self._request("DELETE", record_id)
+        if response.status_code != 204:
+            raise DeleteRecordError(message=response.text or "Error deleting record")
+        return {"status_code": 204}
+
+    async def delete_many(self, record_ids):
+        """
+        Deletes the records with the given IDs concurrently.
+        """
+        return await asyncio.gather(
+            *(self.delete(record_id) for record_id in record_ids)
+        )
+
+    async def aclose(self):
+        """
+        Closes the underlying `httpx.AsyncClient`, if it was created.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
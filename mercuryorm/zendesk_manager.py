@@ -3,20 +3,109 @@ This module contains the `ZendeskObjectManager` class, which manages the operati
 related to Zendesk custom objects and their fields.
 """
 
+import copy
+import functools
 import logging
-import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from dotenv import load_dotenv  # pylint: disable=import-error
 from unidecode import unidecode
 
 from mercuryorm import fields
-from mercuryorm.client.connection import ZendeskAPIClient
+from mercuryorm.client.connection import POOL_MAXSIZE, ZendeskAPIClient
 from mercuryorm.exceptions import (
     NameFieldError,
     NameFieldUniqueAndAutoIncrementConflictError,
 )
 
-load_dotenv()
+# Field creations are independent requests, so they are sent concurrently
+# without exceeding the client's connection pool.
+FIELD_CREATION_WORKERS = min(8, POOL_MAXSIZE)
+
+VALID_FIELD_TYPES = frozenset(
+    {
+        "text",
+        "textarea",
+        "checkbox",
+        "date",
+        "integer",
+        "decimal",
+        "regexp",
+        "dropdown",
+        "lookup",
+        "multiselect",
+    }
+)
+
+CHOICE_FIELD_TYPES = frozenset({"dropdown", "multiselect"})
+
+# Seconds during which custom object and field listings are served from memory.
+SCHEMA_CACHE_TTL = 60
+
+
+@functools.lru_cache(maxsize=None)
+def _model_fields(model):
+    """
+    Introspects a model class once and returns a tuple of
+    `(field_specs, name_fields)`: the `create_custom_object_field` arguments of
+    every declared field except 'name', and the `(attribute, NameField)` pairs.
+    """
+    field_specs = []
+    name_fields = []
+    for field_name, field in vars(model).items():
+        if not isinstance(field, fields.Field):
+            continue
+        if isinstance(field, fields.NameField):
+            name_fields.append((field_name, field))
+        field_key = field.name.lower()
+        if field_key == "name":
+            continue
+        field_type = field.__class__.__name__.lower()
+        if field_type.endswith("field"):
+            field_type = field_type.replace("field", "")
+        field_specs.append(
+            {
+                "field_type": field_type,
+                "key": field_key,
+                "title": field_name.capitalize(),
+                "choices": getattr(field, "choices", None),
+                "is_custom_object": getattr(field, "is_custom_object", None),
+                "related_object": getattr(field, "related_object", None),
+            }
+        )
+    return tuple(field_specs), tuple(name_fields)
+
+
+_SPACES_TO_UNDERSCORES = str.maketrans(" ", "_")
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_choice(choice):
+    """
+    Returns the Zendesk option value for a choice: transliterated to ASCII,
+    lowercased, with spaces replaced by underscores. ASCII choices skip
+    `unidecode` entirely.
+    """
+    if not choice.isascii():
+        choice = unidecode(choice)
+    return choice.lower().translate(_SPACES_TO_UNDERSCORES)
+
+
+@functools.lru_cache(maxsize=256)
+def _choices_to_options(choices):
+    """
+    Builds the Zendesk `custom_field_options` payload for a tuple of
+    dropdown/multiselect choices. Results are cached, so the returned
+    option dicts are shared and must not be mutated.
+    """
+    return tuple(
+        {
+            "name": choice,
+            "raw_name": choice,
+            "value": _normalize_choice(choice),
+        }
+        for choice in choices
+    )
 
 
 class ZendeskObjectManager:
@@ -25,13 +114,41 @@ class ZendeskObjectManager:
     fields, and records. Also provides methods to list existing objects and fields.
     """
 
-    def __init__(self, email=os.getenv("ZENDESK_EMAIL", "mock@mock.com")):
+    def __init__(self, email=None):
         """
         Initializes the ZendeskObjectManager with the given email for authentication.
         Args:
-            email (str): The email associated with the Zendesk account.
+            email (str, optional): The email associated with the Zendesk account.
+            When omitted, the shared client configured from the environment is used;
+            managers for the same email also share one client.
         """
-        self.client = ZendeskAPIClient(email)
+        self.client = (
+            ZendeskAPIClient.for_email(email) if email else ZendeskAPIClient.default()
+        )
+        self._schema_cache = {}
+
+    def _cached_list(self, endpoint, key):
+        """
+        Internal method that returns `response[key]` for a GET on `endpoint`,
+        memoized for `SCHEMA_CACHE_TTL` seconds. Callers get a copy, so mutating
+        it cannot corrupt the cache; error responses are not cached.
+        """
+        cached = self._schema_cache.get(endpoint)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return copy.deepcopy(cached[1])
+        response = self.client.get(endpoint)
+        value = response.get(key, [])
+        if "error" not in response:
+            self._schema_cache[endpoint] = (now + SCHEMA_CACHE_TTL, value)
+        return copy.deepcopy(value)
+
+    def clear_cache(self):
+        """
+        Drops the memoized custom object and field listings, e.g. after the schema
+        was changed outside of this manager.
+        """
+        self._schema_cache.clear()
 
     def get_custom_object(self, key):
         """
@@ -69,7 +186,9 @@ class ZendeskObjectManager:
                 "include_in_list_view": True,
             }
         }
-        return self.client.post(endpoint, data)
+        response = self.client.post(endpoint, data)
+        self._schema_cache.pop(endpoint, None)
+        return response
 
     def get_or_create_custom_object(self, key, title, description):
         """
@@ -98,9 +217,9 @@ class ZendeskObjectManager:
         Returns:
             list: A list of field keys for the custom object.
         """
-        endpoint = f"/custom_objects/{custom_object_key}/fields"
-        response = self.client.get(endpoint)
-        return [field["key"] for field in response.get("custom_object_fields", [])]
+        return [
+            field["key"] for field in self.get_custom_object_fields(custom_object_key)
+        ]
 
     def create_custom_object_field(
         self, custom_object_key, field_type, key, title, **kwargs
@@ -122,21 +241,10 @@ class ZendeskObjectManager:
             return {"message": "Field 'name' is not allowed to be created"}
         if key == "external_id":
             return {"message": "Field 'external_id' is not allowed to be created"}
-        valid_field_types = [
-            "text",
-            "textarea",
-            "checkbox",
-            "date",
-            "integer",
-            "decimal",
-            "regexp",
-            "dropdown",
-            "lookup",
-            "multiselect",
-        ]
-        if field_type not in valid_field_types:
+        if field_type not in VALID_FIELD_TYPES:
             raise ValueError(
-                f"Invalid field type '{field_type}'. Must be one of {valid_field_types}."
+                f"Invalid field type '{field_type}'. "
+                f"Must be one of {sorted(VALID_FIELD_TYPES)}."
             )
         endpoint = f"/custom_objects/{custom_object_key}/fields"
         data = {
@@ -146,15 +254,10 @@ class ZendeskObjectManager:
                 "title": title,
             }
         }
-        if field_type in ["dropdown", "multiselect"] and choices:
-            data["custom_object_field"]["custom_field_options"] = [
-                {
-                    "name": choice,
-                    "raw_name": choice,
-                    "value": unidecode(choice).lower().replace(" ", "_"),
-                }
-                for choice in choices
-            ]
+        if field_type in CHOICE_FIELD_TYPES and choices:
+            data["custom_object_field"]["custom_field_options"] = _choices_to_options(
+                tuple(choices)
+            )
         if field_type == "lookup":
             is_custom_object = kwargs.get("is_custom_object")
             related_object = kwargs.get("related_object")
@@ -167,7 +270,80 @@ class ZendeskObjectManager:
                     "relationship_target_type"
                 ] = f"zen:custom_object:{related_object}"
 
-        return self.client.post(endpoint, data)
+        response = self.client.post(endpoint, data)
+        self._schema_cache.pop(endpoint, None)
+        return response
+
+    def create_custom_object_fields(self, custom_object_key, field_specs):
+        """
+        Creates several fields for a Custom Object concurrently.
+
+        Zendesk appends each new field in the order the requests complete, so
+        once they are all created the fields are reordered to follow
+        `field_specs`, after the fields that already existed.
+        Args:
+            custom_object_key (str): The key of the custom object to add fields to.
+            field_specs (list): The keyword arguments of `create_custom_object_field`
+            (field_type, key, title, ...) for each field.
+
+        Returns:
+            list: The responses from Zendesk API, in the same order as `field_specs`.
+        """
+        if not field_specs:
+            return []
+        workers = min(FIELD_CREATION_WORKERS, len(field_specs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._create_logged_field, custom_object_key, spec)
+                for spec in field_specs
+            ]
+            responses = [future.result() for future in futures]
+        created_ids = [
+            response["custom_object_field"]["id"]
+            for response in responses
+            if response.get("custom_object_field", {}).get("id")
+        ]
+        if len(created_ids) > 1:
+            self._reorder_created_fields(custom_object_key, created_ids)
+        return responses
+
+    def _reorder_created_fields(self, custom_object_key, created_ids):
+        """
+        Internal method that moves the newly created fields, in the given order,
+        after the fields that already existed on the Custom Object.
+        """
+        new_ids = set(created_ids)
+        field_ids = [
+            field["id"]
+            for field in self.get_custom_object_fields(custom_object_key)
+            if field.get("id") and field["id"] not in new_ids
+        ]
+        endpoint = f"/custom_objects/{custom_object_key}/fields"
+        response = self.client.put(
+            f"{endpoint}/reorder",
+            {"custom_object_field_ids": field_ids + created_ids},
+        )
+        self._schema_cache.pop(endpoint, None)
+        if response.get("status_code", 200) >= 400:
+            logging.warning(
+                "Could not reorder the fields of Custom Object '%s': %s",
+                custom_object_key,
+                response,
+            )
+
+    def _create_logged_field(self, custom_object_key, field_spec):
+        """
+        Internal method that creates one field and logs it (run by the worker threads).
+        """
+        response = self.create_custom_object_field(
+            custom_object_key=custom_object_key, **field_spec
+        )
+        logging.info(
+            "Field '%s' created for Custom Object '%s'.",
+            field_spec["key"],
+            custom_object_key,
+        )
+        return response
 
     def update_custom_object_name(
         self,
@@ -208,7 +384,9 @@ class ZendeskObjectManager:
                 }
             }
         }
-        return self.client.put(endpoint, data)
+        response = self.client.put(endpoint, data)
+        self._schema_cache.pop(f"/custom_objects/{custom_object_key}/fields", None)
+        return response
 
     def get_custom_object_fields(self, custom_object_key):
         """
@@ -219,9 +397,9 @@ class ZendeskObjectManager:
         Returns:
             list: A list of field keys for the custom object.
         """
-        endpoint = f"/custom_objects/{custom_object_key}/fields"
-        response = self.client.get(endpoint)
-        return response.get("custom_object_fields", [])
+        return self._cached_list(
+            f"/custom_objects/{custom_object_key}/fields", "custom_object_fields"
+        )
 
     def create_custom_object_record(self, custom_object_key, record_data):
         """
@@ -243,8 +421,7 @@ class ZendeskObjectManager:
         Returns:
             list: A list of custom objects.
         """
-        endpoint = "/custom_objects"
-        return self.client.get(endpoint).get("custom_objects", [])
+        return self._cached_list("/custom_objects", "custom_objects")
 
     def create_custom_object_from_model(self, model):
         """
@@ -255,58 +432,18 @@ class ZendeskObjectManager:
         Returns:
             None
         """
-        for field_name, field in model.__dict__.items():
-            if isinstance(field, fields.NameField):
-                if field_name != "name":
-                    raise NameFieldError()
+        for field_name, _ in _model_fields(model)[1]:
+            if field_name != "name":
+                raise NameFieldError()
 
-        custom_object_key = model.__name__.lower()
-        self.create_custom_object(
+        model_name = model.__name__
+        custom_object_key = model_name.lower()
+        response = self.create_custom_object(
             key=custom_object_key,
-            title=model.__name__,
-            description=f"Custom Object for {model.__name__}",
+            title=model_name,
+            description=f"Custom Object for {model_name}",
         )
-
-        existing_fields = self.list_custom_object_fields(custom_object_key)
-
-        for field_name, field in model.__dict__.items():
-            if isinstance(field, fields.Field):
-                field_key = field.name.lower()
-                if field_key not in existing_fields and field_key != "name":
-                    field_type = field.__class__.__name__.lower()
-                    if field_type.endswith("field"):
-                        field_type = field_type.replace("field", "")
-                    choices = getattr(field, "choices", None)
-                    is_custom_object = getattr(field, "is_custom_object", None)
-                    related_object = getattr(field, "related_object", None)
-                    self.create_custom_object_field(
-                        custom_object_key=custom_object_key,
-                        field_type=field_type,
-                        key=field_key,
-                        title=field_name.capitalize(),
-                        choices=choices,
-                        is_custom_object=is_custom_object,
-                        related_object=related_object,
-                    )
-                    logging.info(
-                        "Field '%s' created for Custom Object '%s'.",
-                        field_key,
-                        custom_object_key,
-                    )
-            if isinstance(field, fields.NameField):
-                self.update_custom_object_name(
-                    custom_object_key=custom_object_key,
-                    unique=field.unique,
-                    autoincrement_enabled=field.autoincrement_enabled,
-                    autoincrement_prefix=field.autoincrement_prefix,
-                    autoincrement_padding=field.autoincrement_padding,
-                    autoincrement_next_sequence=field.autoincrement_next_sequence,
-                )
-                logging.info(
-                    "Field '%s' created for Custom Object '%s'.",
-                    field.name.lower(),
-                    custom_object_key,
-                )
+        self._sync_fields(custom_object_key, model, created="custom_object" in response)
 
     def get_or_create_custom_object_from_model(self, model):
         """
@@ -317,52 +454,51 @@ class ZendeskObjectManager:
         Returns:
             tuple: A tuple of the custom object and a boolean indicating if it was created.
         """
-        custom_object_key = model.__name__.lower()
+        model_name = model.__name__
+        custom_object_key = model_name.lower()
 
         custom_object, created = self.get_or_create_custom_object(
             key=custom_object_key,
-            title=model.__name__,
-            description=f"Custom Object for {model.__name__}",
+            title=model_name,
+            description=f"Custom Object for {model_name}",
+        )
+        self._sync_fields(
+            custom_object_key,
+            model,
+            created=created and "custom_object" in custom_object,
         )
-
-        existing_fields = self.list_custom_object_fields(custom_object_key)
-
-        for field_name, field in model.__dict__.items():
-            if isinstance(field, fields.Field):
-                field_key = field.name.lower()
-                if field_key not in existing_fields and field_key != "name":
-                    field_type = field.__class__.__name__.lower()
-                    if field_type.endswith("field"):
-                        field_type = field_type.replace("field", "")
-                    choices = getattr(field, "choices", None)
-                    is_custom_object = getattr(field, "is_custom_object", None)
-                    related_object = getattr(field, "related_object", None)
-                    self.create_custom_object_field(
-                        custom_object_key=custom_object_key,
-                        field_type=field_type,
-                        key=field_key,
-                        title=field_name.capitalize(),
-                        choices=choices,
-                        is_custom_object=is_custom_object,
-                        related_object=related_object,
-                    )
-                    logging.info(
-                        "Field '%s' created for Custom Object '%s'.",
-                        field_key,
-                        custom_object_key,
-                    )
-            if isinstance(field, fields.NameField):
-                self.update_custom_object_name(
-                    custom_object_key=custom_object_key,
-                    unique=field.unique,
-                    autoincrement_enabled=field.autoincrement_enabled,
-                    autoincrement_prefix=field.autoincrement_prefix,
-                    autoincrement_padding=field.autoincrement_padding,
-                    autoincrement_next_sequence=field.autoincrement_next_sequence,
-                )
-                logging.info(
-                    "Field '%s' created for Custom Object '%s'.",
-                    field.name.lower(),
-                    custom_object_key,
-                )
         return custom_object, created
+
+    def _sync_fields(self, custom_object_key, model, created):
+        """
+        Internal method that applies the model's NameField settings and creates
+        (concurrently) every model field missing from the Custom Object.
+        Args:
+            custom_object_key (str): The key of the custom object.
+            model (type): The model class representing the custom object.
+            created (bool): Whether the custom object was just created, in which
+            case it has no fields yet and the lookup is skipped.
+        """
+        model_field_specs, name_fields = _model_fields(model)
+        for _, field in name_fields:
+            self.update_custom_object_name(
+                custom_object_key=custom_object_key,
+                unique=field.unique,
+                autoincrement_enabled=field.autoincrement_enabled,
+                autoincrement_prefix=field.autoincrement_prefix,
+                autoincrement_padding=field.autoincrement_padding,
+                autoincrement_next_sequence=field.autoincrement_next_sequence,
+            )
+            logging.info(
+                "Field '%s' created for Custom Object '%s'.",
+                field.name.lower(),
+                custom_object_key,
+            )
+
+        existing_fields = (
+            set() if created else set(self.list_custom_object_fields(custom_object_key))
+        )
+        self.create_custom_object_fields(
+            custom_object_key,
+            [spec for spec in model_field_specs if spec["key"] not in existing_fields],
+        )
@@ -23,7 +23,11 @@ setup(
         "requests>=2.31.0",
         "python-dotenv>=1.0.0",
         "Unidecode==1.3.8",
+        "orjson>=3.8.0",
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.24.0"],
+    },
     license="MIT",
     packages=find_packages(),
 )
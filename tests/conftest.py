@@ -1,30 +1,33 @@
 import pytest
+import requests
 import requests_mock
-from unittest.mock import patch
 from mercuryorm.zendesk_manager import ZendeskObjectManager
 from mercuryorm.client.connection import ZendeskAPIClient
 from mercuryorm.record_manager import RecordManager
 from mercuryorm import fields
 
 
-@pytest.fixture
-def zendesk_client(monkeypatch):
-    with patch.object(ZendeskAPIClient, "__init__", return_value=None):
-        client = ZendeskAPIClient()
-        client.base_url = "https://mockdomain.zendesk.com/api/v2"
-        client.auth = None
-        client.headers = {"Content-Type": "application/json"}
-        yield client
+@pytest.fixture(scope="session")
+def base_url():
+    return ZendeskAPIClient.default().base_url
+
+
+@pytest.fixture(scope="module")
+def zendesk_client():
+    client = ZendeskAPIClient.__new__(ZendeskAPIClient)
+    client.base_url = "https://mockdomain.zendesk.com/api/v2"
+    client.auth = None
+    client.headers = {"Content-Type": "application/json"}
+    client.session = requests.Session()
+    yield client
+    client.close()
 
 
 @pytest.fixture
-def zendesk_object_manager():
-    with patch.object(ZendeskAPIClient, "__init__", return_value=None):
-        manager = ZendeskObjectManager()
-        manager.client.base_url = "https://mockdomain.zendesk.com/api/v2"
-        manager.client.headers = {"Content-Type": "application/json"}
-        manager.client.auth = None
-        yield manager
+def zendesk_object_manager(zendesk_client):
+    manager = ZendeskObjectManager()
+    manager.client = zendesk_client
+    yield manager
 
 
 @pytest.fixture
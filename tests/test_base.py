@@ -1,3 +1,10 @@
+import pytest
+from mercuryorm import fields
+from mercuryorm.base import CustomObject
+from mercuryorm.client.connection import ZendeskAPIClient
+from mercuryorm.exceptions import CreateRecordError
+
+
 def test_custom_object_creation(custom_object):
     assert custom_object.name == "Test Object"
     assert custom_object.codigo == "1234"
@@ -74,3 +81,101 @@ def test_custom_object_delete(requests_mock, custom_object, zendesk_client):
 
     response_status = custom_object.delete()
     assert response_status == 204
+
+
+class Product(CustomObject):
+    name = fields.NameField(unique=True)
+    code = fields.TextField("code")
+    active = fields.CheckboxField("active")
+
+
+def test_custom_object_subclass_fields():
+    assert Product._field_names == ("name", "code", "active")
+    product = Product(name="Sample", code="123")
+    assert product.name == "Sample"
+    assert product.code == "123"
+    assert product.active is None
+
+
+def test_custom_object_subclass_to_dict():
+    product = Product(name="Sample", code="123", active=True)
+    product.external_id = "ext-1"
+    assert product.to_dict() == {
+        "name": "Sample",
+        "code": "123",
+        "active": True,
+        "external_id": "ext-1",
+    }
+
+
+def test_custom_object_to_dict_is_generated_per_subclass():
+    assert Product.to_dict is not CustomObject.to_dict
+    assert Product.to_dict.__qualname__ == "Product.to_dict"
+
+    class CustomProduct(Product):
+        def to_dict(self):
+            return {"custom": True}
+
+    assert CustomProduct(name="Sample").to_dict() == {"custom": True}
+
+
+def test_custom_object_name_autoincrement_is_cached_on_class():
+    class Ticket(CustomObject):
+        name = fields.NameField(autoincrement_enabled=True, autoincrement_prefix="T_")
+
+    assert Ticket._name_autoincrement is True
+    assert Ticket().is_namefield_autoincrement() is True
+    assert Product().is_namefield_autoincrement() is False
+
+
+def test_custom_object_shares_default_client():
+    first, second = Product(), Product()
+    assert first.client is second.client
+    assert "client" not in first.__dict__
+
+
+def test_custom_object_client_override():
+    with ZendeskAPIClient("other@example.com") as other:
+        product = Product()
+        product.client = other
+        assert product.client is other
+        assert Product().client is ZendeskAPIClient.default()
+
+
+def test_custom_object_delete_uses_lowercase_key(requests_mock, base_url):
+    product = Product(name="Sample")
+    product.id = "1"
+    url = f"{base_url}/custom_objects/product/records/1"
+    delete_mock = requests_mock.delete(url, status_code=204)
+
+    assert product.delete() == {"status_code": 204}
+    assert delete_mock.last_request.url == url
+
+
+def test_bulk_create_sends_chunked_jobs(requests_mock, base_url):
+    jobs = requests_mock.post(
+        f"{base_url}/custom_objects/product/jobs",
+        json={"job_status": {"id": "job-1", "status": "queued"}},
+    )
+    products = [Product(name=f"P{index}", code=str(index)) for index in range(5)]
+
+    statuses = Product.objects.bulk_create(products, chunk_size=2)
+
+    assert len(statuses) == 3
+    assert jobs.call_count == 3
+    first_job = jobs.request_history[0].json()["job"]
+    assert first_job["action"] == "create"
+    assert [item["name"] for item in first_job["items"]] == ["P0", "P1"]
+    assert first_job["items"][0]["custom_object_fields"]["code"] == "0"
+
+
+def test_bulk_create_rejected_job(requests_mock, base_url):
+    requests_mock.post(
+        f"{base_url}/custom_objects/product/jobs",
+        status_code=422,
+        json={"details": "Invalid items"},
+    )
+    with pytest.raises(CreateRecordError):
+        Product.objects.bulk_create([Product(name="P0")])
+    with pytest.raises(ValueError):
+        Product.objects.bulk_create([], chunk_size=101)
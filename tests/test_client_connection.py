@@ -1,6 +1,18 @@
+import os
+from unittest.mock import patch
+
 import pytest
 import requests
 
+from mercuryorm.client.connection import ZendeskAPIClient, _default_settings
+
+
+@pytest.fixture
+def fresh_settings():
+    _default_settings.cache_clear()
+    yield
+    _default_settings.cache_clear()
+
 
 def test_get_request_success(zendesk_client, requests_mock):
     # Mock the GET request to the Zendesk API
@@ -120,3 +132,125 @@ def test_delete_request_failure(zendesk_client, requests_mock):
         },
         "status_code": 404,
     }
+
+
+def test_requests_reuse_session(zendesk_client, requests_mock):
+    url = f"{zendesk_client.base_url}/test_endpoint"
+    requests_mock.get(url, json={"success": True}, status_code=200)
+
+    with patch.object(
+        zendesk_client.session, "request", wraps=zendesk_client.session.request
+    ) as session_request:
+        zendesk_client.get("/test_endpoint")
+        zendesk_client.get("/test_endpoint")
+
+    assert session_request.call_count == 2
+
+
+def test_session_headers_and_auth():
+    client = ZendeskAPIClient()
+    assert client.session.auth is client.auth
+    assert client.session.headers["Content-Type"] == "application/json"
+    assert client.session.get_adapter("https://").max_retries.total == 3
+
+
+def test_rate_limited_writes_are_retried():
+    retry = ZendeskAPIClient.default().session.get_adapter("https://").max_retries
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("PATCH", 429, has_retry_after=True)
+    assert not retry.is_retry("POST", 503)
+    assert retry.is_retry("GET", 503)
+    assert isinstance(retry.increment("POST", "/records"), type(retry))
+
+
+def test_context_manager_closes_session():
+    client = ZendeskAPIClient()
+    with patch.object(client.session, "close") as session_close:
+        with client:
+            pass
+    session_close.assert_called_once()
+
+
+def test_default_client_is_shared():
+    assert ZendeskAPIClient.default() is ZendeskAPIClient.default()
+
+
+def test_http2_backend(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    monkeypatch.setenv("MERCURY_USE_HTTP2", "1")
+    client = ZendeskAPIClient()
+    assert isinstance(client._http, httpx.Client)
+    assert client.session is None
+
+    response = httpx.Response(
+        404, request=httpx.Request("GET", f"{client.base_url}/test_endpoint")
+    )
+    with patch.object(client._http, "request", return_value=response) as request:
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get("/test_endpoint")
+    request.assert_called_once_with("GET", "/test_endpoint", params=None, timeout=10)
+    client.close()
+
+
+def test_env_file_not_read_when_environment_is_set(monkeypatch, fresh_settings):
+    monkeypatch.setenv("ZENDESK_EMAIL", "agent@example.com")
+    monkeypatch.setenv("ZENDESK_API_TOKEN", "token")
+    monkeypatch.setenv("ZENDESK_SUBDOMAIN", "example")
+    with patch("mercuryorm.client.connection._load_env") as load_env:
+        client = ZendeskAPIClient()
+    load_env.assert_not_called()
+    assert client.email == "agent@example.com"
+    assert client.base_url == "https://example.zendesk.com/api/v2"
+
+
+def test_env_file_read_when_environment_is_missing(monkeypatch, fresh_settings):
+    monkeypatch.delenv("ZENDESK_API_TOKEN", raising=False)
+    with patch("mercuryorm.client.connection._load_env") as load_env:
+        ZendeskAPIClient()
+    load_env.assert_called_once()
+
+
+def test_default_settings_resolved_once(fresh_settings):
+    with patch("mercuryorm.client.connection.os.getenv", wraps=os.getenv) as getenv:
+        first = ZendeskAPIClient()
+        getenv.reset_mock()
+        second = ZendeskAPIClient()
+    assert second.auth is first.auth
+    assert not any(
+        call.args[0].startswith("ZENDESK_") for call in getenv.call_args_list
+    )
+
+
+def test_custom_email_gets_own_auth():
+    with ZendeskAPIClient("other@example.com") as client:
+        assert client.auth is not ZendeskAPIClient.default().auth
+        assert client.auth.username == "other@example.com/token"
+
+
+def test_client_shared_per_email():
+    other = ZendeskAPIClient.for_email("other@example.com")
+    try:
+        assert ZendeskAPIClient.for_email("other@example.com") is other
+        assert other is not ZendeskAPIClient.default()
+        default_email = ZendeskAPIClient.default().email
+        assert ZendeskAPIClient.for_email(default_email) is ZendeskAPIClient.default()
+    finally:
+        other.close()
+        ZendeskAPIClient.for_email.cache_clear()
+
+
+def test_post_body_serialized_once(zendesk_client, requests_mock):
+    url = f"{zendesk_client.base_url}/test_endpoint"
+    requests_mock.post(url, json={"id": "123"}, status_code=201)
+
+    zendesk_client.post("/test_endpoint", {"name": "Tést"})
+    assert requests_mock.last_request.body == '{"name":"Tést"}'.encode()
+
+
+def test_post_body_falls_back_for_big_integers(zendesk_client, requests_mock):
+    url = f"{zendesk_client.base_url}/test_endpoint"
+    requests_mock.post(url, json={"id": "123"}, status_code=201)
+
+    zendesk_client.post("/test_endpoint", {"id": 2**64})
+    assert requests_mock.last_request.json() == {"id": 2**64}
@@ -0,0 +1,30 @@
+import pickle
+
+import pytest
+from mercuryorm import fields
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        fields.NameField(autoincrement_enabled=True, autoincrement_prefix="PROD_"),
+        fields.TextField("code"),
+        fields.DateField("due_date"),
+        fields.RegexpField("zip", r"\d{5}"),
+        fields.DropdownField("status", ["Open", "Closed"]),
+        fields.MultiselectField("tags", ["A", "B"]),
+        fields.LookupField("product", "product"),
+    ],
+)
+def test_fields_have_no_instance_dict(field):
+    assert not hasattr(field, "__dict__")
+    with pytest.raises(AttributeError):
+        field.unknown = True
+
+
+def test_fields_pickle_roundtrip():
+    field = fields.DropdownField("status", ["Open", "Closed"])
+    restored = pickle.loads(pickle.dumps(field))
+    assert restored.name == "status"
+    assert restored.field_type == "dropdown"
+    assert restored.choices == ["Open", "Closed"]
@@ -1,6 +1,5 @@
 import pytest
 import requests
-from mercuryorm.client.connection import ZendeskAPIClient
 from mercuryorm.managers import QuerySet
 
 
@@ -16,7 +15,7 @@ def queryset():
     return QuerySet(model=MockModel)
 
 
-def test_all_records(queryset, requests_mock):
+def test_all_records(queryset, requests_mock, base_url):
     url = f"/custom_objects/{queryset.model.__name__.lower()}/records"
     mock_response = {
         "custom_object_records": [
@@ -32,7 +31,7 @@ def test_all_records(queryset, requests_mock):
             },
         ]
     }
-    requests_mock.get(f"{ZendeskAPIClient().base_url}{url}", json=mock_response)
+    requests_mock.get(f"{base_url}{url}", json=mock_response)
 
     records = queryset.all()
     assert len(records) == 2
@@ -40,8 +39,7 @@ def test_all_records(queryset, requests_mock):
     assert records[1].id == "2"
 
 
-def test_all_with_pagination(queryset, requests_mock):
-    base_url = ZendeskAPIClient().base_url
+def test_all_with_pagination(queryset, requests_mock, base_url):
     url = f"/custom_objects/{queryset.model.__name__.lower()}/records"
     count_url = f"{base_url}{url}/count"
 
@@ -73,7 +71,7 @@ def test_all_with_pagination(queryset, requests_mock):
 
 
 
-def test_filter_records(queryset, requests_mock):
+def test_filter_records(queryset, requests_mock, base_url):
     url = f"/custom_objects/{queryset.model.__name__.lower()}/records"
     mock_response = {
         "custom_object_records": [
@@ -89,7 +87,7 @@ def test_filter_records(queryset, requests_mock):
             },
         ]
     }
-    requests_mock.get(f"{ZendeskAPIClient().base_url}{url}", json=mock_response)
+    requests_mock.get(f"{base_url}{url}", json=mock_response)
 
     records = queryset.filter(field1="value1")
 
@@ -140,8 +138,7 @@ def test_parse_record_fields(queryset):
     assert record.updated_by_user_id == "user456"
 
 
-def test_all_with_pagination_after_cursor(queryset, requests_mock):
-    base_url = ZendeskAPIClient().base_url
+def test_all_with_pagination_after_cursor(queryset, requests_mock, base_url):
     url = f"/custom_objects/{queryset.model.__name__.lower()}/records"
     count_url = f"{base_url}{url}/count"
 
@@ -158,7 +155,7 @@ def test_all_with_pagination_after_cursor(queryset, requests_mock):
         "meta": {"page_size": 1},
         "links": {"next": "next_url"},
     }
-    requests_mock.get(f"{ZendeskAPIClient().base_url}{url}", json=mock_response)
+    requests_mock.get(f"{base_url}{url}", json=mock_response)
 
     response = queryset.all_with_pagination(
         page_size=1, after_cursor="abc123"
@@ -168,3 +165,38 @@ def test_all_with_pagination_after_cursor(queryset, requests_mock):
     assert response["results"][0].id == "3"
     assert response["meta"]["page_size"] == 1
     assert response["links"]["next"] == "next_url"
+
+
+def test_filter_records_follows_pagination(queryset, requests_mock, base_url):
+    url = f"{base_url}/custom_objects/mockmodel/records"
+    records_get = requests_mock.get(
+        url,
+        [
+            {
+                "json": {
+                    "custom_object_records": [
+                        {"id": "1", "custom_object_fields": {"field1": "value1"}}
+                    ],
+                    "links": {"next": f"{url}?page[after]=abc&page[size]=100"},
+                }
+            },
+            {
+                "json": {
+                    "custom_object_records": [
+                        {"id": "2", "custom_object_fields": {"field1": "value1"}}
+                    ],
+                    "links": {"next": None},
+                }
+            },
+        ],
+    )
+
+    records = queryset.filter(field1="value1")
+
+    assert [record.id for record in records] == ["1", "2"]
+    assert records_get.call_count == 2
+    assert records_get.request_history[0].qs == {"page[size]": ["100"]}
+    assert records_get.request_history[1].qs == {
+        "page[size]": ["100"],
+        "page[after]": ["abc"],
+    }
@@ -1,12 +1,16 @@
+import asyncio
+import functools
+
 import pytest
 from mercuryorm.zendesk_manager import ZendeskAPIClient
 from mercuryorm.exceptions import BadRequestError, NotFoundError
+from .conftest import MockModel
 
 
-def test_create_record(record_manager, requests_mock):
+def test_create_record(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     requests_mock.post(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}",
+        f"{base_url}/custom_objects/{url}",
         json={"custom_object_record": {"id": "123"}},
     )
 
@@ -17,36 +21,32 @@ def test_create_record(record_manager, requests_mock):
     assert "custom_object_fields" in record
 
 
-def test_get_record_by_id(record_manager, requests_mock):
+def test_get_record_by_id(record_manager, requests_mock, base_url):
     # Mock da requisição GET para obter um record pelo ID
     record_id = "123"
     url = f"{record_manager.model.__name__.lower()}/records/{record_id}"
     mock_response = {"custom_object_record": {"id": record_id, "name": "Test Record"}}
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", json=mock_response
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", json=mock_response)
 
     record = record_manager.get(id=record_id)
     assert record.id == record_id
     assert record.name == "Test Record"
 
 
-def test_get_record_not_found(record_manager, requests_mock):
+def test_get_record_not_found(record_manager, requests_mock, base_url):
     record_id = "nonexistent"
     url = f"{record_manager.model.__name__.lower()}/records/{record_id}"
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", status_code=404
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", status_code=404)
 
     with pytest.raises(NotFoundError):
         record_manager.get(id=record_id)
 
 
-def test_get_bad_request(record_manager, requests_mock):
+def test_get_bad_request(record_manager, requests_mock, base_url):
     record_id = "invalid"
     url = f"{record_manager.model.__name__.lower()}/records/{record_id}"
     requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}",
+        f"{base_url}/custom_objects/{url}",
         status_code=400,
         json={"error": "Bad Request"},
     )
@@ -55,7 +55,7 @@ def test_get_bad_request(record_manager, requests_mock):
         record_manager.get(id=record_id)
 
 
-def test_filter_records(record_manager, requests_mock):
+def test_filter_records(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     mock_response = {
         "custom_object_records": [
@@ -63,9 +63,7 @@ def test_filter_records(record_manager, requests_mock):
             {"id": "2", "name": "Qualquer"},
         ]
     }
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", json=mock_response
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", json=mock_response)
 
     records = record_manager.filter(name="Record 1")
     record_some = record_manager.filter(name="Qualquer")
@@ -73,36 +71,32 @@ def test_filter_records(record_manager, requests_mock):
     assert record_some[0].id == "2"
 
 
-def test_get_last_record(record_manager, requests_mock):
+def test_get_last_record(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     mock_response = {
         "custom_object_records": [
             {"id": "3", "name": "Last Record", "updated_at": "2024-09-29T08:02:57Z"}
         ]
     }
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", json=mock_response
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", json=mock_response)
 
     last_record = record_manager.last()
     assert last_record.id == "3"
     assert last_record.name == "Last Record"
 
 
-def test_delete_record(record_manager, requests_mock):
+def test_delete_record(record_manager, requests_mock, base_url):
     record_id = "123"
     url = f"{record_manager.model.__name__.lower()}/records/{record_id}"
-    requests_mock.delete(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", status_code=204
-    )
+    requests_mock.delete(f"{base_url}/custom_objects/{url}", status_code=204)
     response = record_manager.delete(record_id)
     assert response == {"status_code": 204}
 
 
-def test_no_records_found(record_manager, requests_mock):
+def test_no_records_found(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}",
+        f"{base_url}/custom_objects/{url}",
         json={"custom_object_records": []},
     )
 
@@ -110,7 +104,7 @@ def test_no_records_found(record_manager, requests_mock):
         record_manager.get(name="Nonexistent Record")
 
 
-def test_multiple_records_found(record_manager, requests_mock):
+def test_multiple_records_found(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     mock_response = {
         "custom_object_records": [
@@ -118,15 +112,13 @@ def test_multiple_records_found(record_manager, requests_mock):
             {"id": "2", "name": "Record 2"},
         ]
     }
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", json=mock_response
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", json=mock_response)
 
     with pytest.raises(ValueError):
         record_manager.get(name="Multiple Records")
 
 
-def test_get_all(record_manager, requests_mock):
+def test_get_all(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     mock_response = {
         "custom_object_records": [
@@ -134,18 +126,81 @@ def test_get_all(record_manager, requests_mock):
             {"id": "2", "name": "Qualquer"},
         ]
     }
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", json=mock_response
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", json=mock_response)
     all = record_manager.all()
     assert len(all) > 1
 
 
-def test_get_last_none(record_manager, requests_mock):
+def test_get_last_none(record_manager, requests_mock, base_url):
     url = f"{record_manager.model.__name__.lower()}/records"
     mock_response = {}
-    requests_mock.get(
-        f"{ZendeskAPIClient().base_url}/custom_objects/{url}", json=mock_response
-    )
+    requests_mock.get(f"{base_url}/custom_objects/{url}", json=mock_response)
     last = record_manager.last()
     assert last == None
+
+
+def test_record_manager_uses_shared_client(record_manager):
+    assert record_manager.client is ZendeskAPIClient.default()
+    assert record_manager.queryset.client is record_manager.client
+
+
+@pytest.fixture
+def async_record_manager(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    from mercuryorm.record_manager import AsyncRecordManager
+
+    async def handler(request):
+        # Yield to the loop so concurrent requests queue on the semaphore.
+        await asyncio.sleep(0)
+        record_id = request.url.path.rsplit("/", 1)[-1]
+        if record_id == "missing":
+            return httpx.Response(404, json={"error": "RecordNotFound"})
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(
+            200, json={"custom_object_record": {"id": record_id, "name": "Record"}}
+        )
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    return AsyncRecordManager(MockModel, max_concurrency=2)
+
+
+def test_async_get_many(async_record_manager):
+    async def run():
+        async with async_record_manager as manager:
+            return await manager.get_many(["1", "2", "3"])
+
+    records = asyncio.run(run())
+    assert [record.id for record in records] == ["1", "2", "3"]
+
+
+def test_async_get_not_found(async_record_manager):
+    async def run():
+        async with async_record_manager as manager:
+            await manager.get("missing")
+
+    with pytest.raises(NotFoundError):
+        asyncio.run(run())
+
+
+def test_async_delete_many(async_record_manager):
+    async def run():
+        async with async_record_manager as manager:
+            return await manager.delete_many(["1", "2"])
+
+    assert asyncio.run(run()) == [{"status_code": 204}, {"status_code": 204}]
+
+
+def test_async_manager_reused_across_event_loops(async_record_manager):
+    async def run():
+        async with async_record_manager as manager:
+            return await manager.get_many(["1", "2", "3", "4", "5"])
+
+    for _ in range(2):
+        records = asyncio.run(run())
+        assert [record.id for record in records] == ["1", "2", "3", "4", "5"]
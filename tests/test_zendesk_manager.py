@@ -1,4 +1,6 @@
 import pytest
+from mercuryorm import fields
+from mercuryorm.exceptions import NameFieldError
 from .conftest import MockModel
 
 
@@ -198,3 +200,203 @@ def test_list_custom_objects_fields(zendesk_object_manager, requests_mock):
 
     object_fields_list = zendesk_object_manager.list_custom_object_fields("test_object")
     assert object_fields_list == ["codigo"]
+
+
+def test_create_custom_object_fields(zendesk_object_manager, requests_mock):
+    url = f"{zendesk_object_manager.client.base_url}/custom_objects/test_object/fields"
+    field_ids = {"codigo": "2", "ativo": "3", "preco": "4"}
+
+    def created_field(request, context):
+        key = request.json()["custom_object_field"]["key"]
+        return {"custom_object_field": {"id": field_ids[key], "key": key}}
+
+    requests_mock.post(url, json=created_field)
+    # Zendesk lists the new fields in completion order, not declaration order.
+    requests_mock.get(
+        url,
+        json={
+            "custom_object_fields": [
+                {"id": "1", "key": "existente"},
+                {"id": "4", "key": "preco"},
+                {"id": "2", "key": "codigo"},
+                {"id": "3", "key": "ativo"},
+            ]
+        },
+    )
+    reorder = requests_mock.put(f"{url}/reorder", json={})
+
+    responses = zendesk_object_manager.create_custom_object_fields(
+        "test_object",
+        [
+            {"field_type": "text", "key": "codigo", "title": "Codigo"},
+            {"field_type": "checkbox", "key": "ativo", "title": "Ativo"},
+            {"field_type": "decimal", "key": "preco", "title": "Preco"},
+        ],
+    )
+    assert [response["custom_object_field"]["key"] for response in responses] == [
+        "codigo",
+        "ativo",
+        "preco",
+    ]
+    assert reorder.call_count == 1
+    assert reorder.last_request.json() == {
+        "custom_object_field_ids": ["1", "2", "3", "4"]
+    }
+
+
+def test_create_custom_object_fields_propagates_errors(zendesk_object_manager):
+    with pytest.raises(ValueError):
+        zendesk_object_manager.create_custom_object_fields(
+            "test_object", [{"field_type": "json", "key": "codigo", "title": "Codigo"}]
+        )
+
+
+def test_get_or_create_custom_object_from_model(zendesk_object_manager, requests_mock):
+    base_url = zendesk_object_manager.client.base_url
+    requests_mock.get(
+        f"{base_url}/custom_objects",
+        json={"custom_objects": [{"key": "mockmodel", "title": "MockModel"}]},
+    )
+    requests_mock.get(
+        f"{base_url}/custom_objects/mockmodel/fields",
+        json={"custom_object_fields": [{"key": "codigo"}]},
+    )
+    fields_post = requests_mock.post(
+        f"{base_url}/custom_objects/mockmodel/fields",
+        json={"custom_object_field": {"key": "ativo"}},
+    )
+
+    result = zendesk_object_manager.get_or_create_custom_object_from_model(MockModel)
+    custom_object, created = result
+    assert custom_object["key"] == "mockmodel"
+    assert not created
+    assert fields_post.call_count == 1
+    assert fields_post.last_request.json()["custom_object_field"] == {
+        "type": "checkbox",
+        "key": "ativo",
+        "title": "Ativo",
+    }
+
+
+def test_get_or_create_custom_object_from_model_created(
+    zendesk_object_manager, requests_mock
+):
+    base_url = zendesk_object_manager.client.base_url
+    requests_mock.get(f"{base_url}/custom_objects", json={"custom_objects": []})
+    requests_mock.post(
+        f"{base_url}/custom_objects", json={"custom_object": {"key": "mockmodel"}}
+    )
+    fields_get = requests_mock.get(
+        f"{base_url}/custom_objects/mockmodel/fields",
+        json={"custom_object_fields": []},
+    )
+    fields_post = requests_mock.post(
+        f"{base_url}/custom_objects/mockmodel/fields",
+        json={"custom_object_field": {}},
+    )
+
+    _, created = zendesk_object_manager.get_or_create_custom_object_from_model(
+        MockModel
+    )
+    assert created
+    assert not fields_get.called
+    assert fields_post.call_count == 2
+
+
+def test_list_custom_objects_is_cached(zendesk_object_manager, requests_mock):
+    url = f"{zendesk_object_manager.client.base_url}/custom_objects"
+    list_get = requests_mock.get(url, json={"custom_objects": [{"key": "test_object"}]})
+    requests_mock.post(url, json={"custom_object": {"key": "other_object"}})
+
+    zendesk_object_manager.list_custom_objects()
+    zendesk_object_manager.get_custom_object("test_object")
+    assert list_get.call_count == 1
+
+    zendesk_object_manager.create_custom_object(key="other_object", title="Other")
+    zendesk_object_manager.list_custom_objects()
+    assert list_get.call_count == 2
+
+
+def test_list_custom_object_fields_is_cached(zendesk_object_manager, requests_mock):
+    url = f"{zendesk_object_manager.client.base_url}/custom_objects/test_object/fields"
+    fields_get = requests_mock.get(
+        url, json={"custom_object_fields": [{"key": "codigo"}]}
+    )
+    requests_mock.post(url, json={"custom_object_field": {"key": "ativo"}})
+
+    assert zendesk_object_manager.list_custom_object_fields("test_object") == ["codigo"]
+    assert zendesk_object_manager.get_custom_object_fields("test_object") == [
+        {"key": "codigo"}
+    ]
+    assert fields_get.call_count == 1
+
+    zendesk_object_manager.create_custom_object_field(
+        custom_object_key="test_object",
+        field_type="checkbox",
+        key="ativo",
+        title="Ativo",
+    )
+    zendesk_object_manager.list_custom_object_fields("test_object")
+    assert fields_get.call_count == 2
+
+    zendesk_object_manager.clear_cache()
+    zendesk_object_manager.list_custom_object_fields("test_object")
+    assert fields_get.call_count == 3
+
+
+def test_cached_listing_is_copied(zendesk_object_manager, requests_mock):
+    url = f"{zendesk_object_manager.client.base_url}/custom_objects"
+    requests_mock.get(url, json={"custom_objects": [{"key": "test_object"}]})
+
+    custom_objects = zendesk_object_manager.list_custom_objects()
+    custom_objects[0]["key"] = "changed"
+    custom_objects.clear()
+
+    assert zendesk_object_manager.get_custom_object("test_object") == {
+        "key": "test_object"
+    }
+
+
+def test_error_listing_is_not_cached(zendesk_object_manager, requests_mock):
+    url = f"{zendesk_object_manager.client.base_url}/custom_objects"
+    list_get = requests_mock.get(
+        url,
+        [
+            {"text": "Service Unavailable"},
+            {"json": {"custom_objects": [{"key": "test_object"}]}},
+        ],
+    )
+
+    assert zendesk_object_manager.list_custom_objects() == []
+    assert zendesk_object_manager.list_custom_objects() == [{"key": "test_object"}]
+    assert list_get.call_count == 2
+
+
+def test_create_custom_object_field_dropdown_options(
+    zendesk_object_manager, requests_mock
+):
+    url = f"{zendesk_object_manager.client.base_url}/custom_objects/test_object/fields"
+    field_post = requests_mock.post(url, json={"custom_object_field": {}})
+
+    zendesk_object_manager.create_custom_object_field(
+        custom_object_key="test_object",
+        field_type="dropdown",
+        key="status",
+        title="Status",
+        choices=["Em análise", "Done"],
+    )
+    options = field_post.last_request.json()["custom_object_field"][
+        "custom_field_options"
+    ]
+    assert options == [
+        {"name": "Em análise", "raw_name": "Em análise", "value": "em_analise"},
+        {"name": "Done", "raw_name": "Done", "value": "done"},
+    ]
+
+
+def test_create_custom_object_from_model_misnamed_name_field(zendesk_object_manager):
+    class Misnamed:
+        title = fields.NameField(unique=True)
+
+    with pytest.raises(NameFieldError):
+        zendesk_object_manager.create_custom_object_from_model(Misnamed)